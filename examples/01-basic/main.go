@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bytes"
 	"fmt"
 	"log"
 	"os"
@@ -65,42 +66,85 @@ func createTestFiles() error {
 
 	// Create script for generating test files
 	pyScript := `
+import argparse
+import os
+
 import h5py
 import numpy as np
 
-print("Creating test HDF5 files...")
-
-# Version 0 file (HDF5 1.0)
-filename = 'testdata/v0.h5'
-with h5py.File(filename, 'w', libver='earliest') as f:
-    f.create_dataset('test', data=[1, 2, 3])
-print(f'Created: {filename}')
-
-# Version 2 file (HDF5 1.8)
-filename = 'testdata/v2.h5'
-with h5py.File(filename, 'w', libver='v108') as f:
-    f.create_dataset('data', data=np.arange(10))
-print(f'Created: {filename}')
-
-# Version 3 file (HDF5 1.10+)
-filename = 'testdata/v3.h5'
-with h5py.File(filename, 'w', libver='latest') as f:
-    f.create_dataset('data', data=np.arange(10))
-print(f'Created: {filename}')
-
-# File with groups
-filename = 'testdata/with_groups.h5'
-with h5py.File(filename, 'w', libver='v108') as f:
-    f.create_dataset('dataset1', data=[1.1, 2.2, 3.3])
+# Shared input buffers; h5py copies them on write, so builders can alias them.
+_TEST_ARR = np.arange(10, dtype=np.int64)
+_THREE_INT = np.array([1, 2, 3], dtype=np.int64)
+_THREE_FLOAT = np.array([1.1, 2.2, 3.3], dtype=np.float64)
+
+
+def build_test(f):
+    f.create_dataset('test', data=_THREE_INT)
+
+
+def build_data(f):
+    f.create_dataset('data', data=_TEST_ARR)
+
+
+def build_with_groups(f):
+    f.create_dataset('dataset1', data=_THREE_FLOAT)
     grp = f.create_group('subgroup')
-    grp.create_dataset('dataset2', data=[4, 5, 6])
-    grp.create_group('nested_group').create_dataset('nested_data', data=[7, 8, 9])
-print(f'Created: {filename}')
+    grp.create_dataset('dataset2', data=np.array([4, 5, 6], dtype=np.int64))
+    grp.create_group('nested_group').create_dataset('nested_data', data=np.array([7, 8, 9], dtype=np.int64))
+
+
+# (filename, libver, builder): earliest -> superblock v0, v108 -> v2, latest -> v3
+SPECS = [
+    ('testdata/v0.h5', 'earliest', build_test),
+    ('testdata/v2.h5', 'v108', build_data),
+    ('testdata/v3.h5', 'latest', build_data),
+    ('testdata/with_groups.h5', 'v108', build_with_groups),
+]
+
+
+def is_up_to_date(filename):
+    return os.path.exists(filename) and os.path.getmtime(filename) > os.path.getmtime(__file__)
+
+
+def build_all(only=None, force=False):
+    results = []
+    for filename, libver, build in SPECS:
+        if only and os.path.basename(filename) not in only:
+            continue
+        if not force and is_up_to_date(filename):
+            results.append(('Up to date', filename))
+            continue
+        # Build into a temp file so a failed build never leaves a file that
+        # later runs would treat as up to date.
+        tmp = filename + '.tmp'
+        try:
+            with h5py.File(tmp, 'w', libver=libver) as f:
+                build(f)
+            os.replace(tmp, filename)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        results.append(('Created', filename))
+    return results
+
+
+parser = argparse.ArgumentParser(description='Generate test HDF5 files')
+parser.add_argument('--only', nargs='+', metavar='NAME',
+                    choices=[os.path.basename(name) for name, _, _ in SPECS], help='only build these files (e.g. v0.h5)')
+parser.add_argument('--force', action='store_true', help='rebuild files even if up to date')
+args = parser.parse_args()
+
+msgs = [f'{status}: {filename}' for status, filename in build_all(args.only, args.force)]
+print('\n'.join(msgs) if msgs else 'No test files selected')
 `
 
+	// Only rewrite the script when it changed, so its mtime stays older than
+	// the files it generated and up-to-date files are skipped.
 	pyFile := "testdata/create_test_files.py"
-	if err := os.WriteFile(pyFile, []byte(pyScript), 0644); err != nil {
-		return fmt.Errorf("failed to write Python script: %v", err)
+	if existing, err := os.ReadFile(pyFile); err != nil || !bytes.Equal(existing, []byte(pyScript)) {
+		if err := os.WriteFile(pyFile, []byte(pyScript), 0644); err != nil {
+			return fmt.Errorf("failed to write Python script: %v", err)
+		}
 	}
 
 	cmd := exec.Command(getPythonCommand(), pyFile)